@@ -12,16 +12,16 @@ from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QLabel,
-    QTextEdit,
     QMessageBox
 )
 
 import jarvis_chat 
+from transcript import TranscriptModel, TranscriptView
 
 
 class JarvisApp(QWidget):
 
-    text_signal = pyqtSignal(str)
+    text_signal = pyqtSignal(str, str)
 
     def __init__(self):
 
@@ -45,12 +45,13 @@ class JarvisApp(QWidget):
         self.title_fade_values = [0.0] * len(self.full_title_text)
         self.title_anim_timer.start(200)
 
-        self.text = QTextEdit(readOnly=True)
+        self.transcript = TranscriptModel(parent=self)
+        self.text = TranscriptView(self.transcript)
         self.text.setFont(QFont("Consolas", 12))
         self.text.setStyleSheet("background:#222; border:none; color:#eee; padding:5px;")
         layout.addWidget(self.text, stretch=3)
 
-        self.text_signal.connect(lambda msg: self.text.append(msg))
+        self.text_signal.connect(self.transcript.append)
 
         pg.setConfigOptions(useOpenGL=True, antialias=True)
         self.plot = pg.PlotWidget(background="#111")
@@ -129,9 +130,7 @@ class JarvisApp(QWidget):
 
     def show_text(self, msg: str):
 
-
-        html = f"<b style='color:#0ff;'>JARVIS:</b> {msg}"
-        self.text_signal.emit(html)
+        self.text_signal.emit("JARVIS", msg)
 
     def show_greeting(self):
 
@@ -0,0 +1,116 @@
+"""
+Audio sources for running several listeners in one process.
+
+A source yields raw 16-bit mono PCM frames through read(frames), which
+returns (data, overflowed) like sd.RawInputStream.read so handle_command
+can consume either.
+"""
+import queue
+import wave
+
+import sounddevice as sd
+
+QUEUE_FRAMES = 200
+
+
+class MicrophoneSource:
+    """
+    Captures a sounddevice input into its own bounded frame queue. When the
+    consumer falls behind, the oldest frames are dropped.
+    """
+
+    def __init__(self, name, device=None, samplerate=16000, frame_length=512):
+        self.name = name
+        self.device = device
+        self.samplerate = samplerate
+        self.frame_length = frame_length
+        self.frames = queue.Queue(maxsize=QUEUE_FRAMES)
+        self.stream = None
+
+    def _callback(self, indata, frames, time_info, status):
+        self._push(bytes(indata))
+
+    def _push(self, data):
+        try:
+            self.frames.put_nowait(data)
+        except queue.Full:
+            try:
+                self.frames.get_nowait()
+            except queue.Empty:
+                pass
+            self.frames.put_nowait(data)
+
+    def start(self):
+        self.stream = sd.RawInputStream(
+            samplerate=self.samplerate,
+            blocksize=self.frame_length,
+            dtype="int16",
+            channels=1,
+            device=self.device,
+            callback=self._callback,
+        )
+        self.stream.start()
+
+    def read(self, frames):
+        return self.frames.get(), False
+
+    def close(self):
+        if self.stream is not None:
+            try:
+                self.stream.stop()
+                self.stream.close()
+            except Exception:
+                pass
+            self.stream = None
+        self._push(b"")
+
+
+class WavFileSource:
+    """
+    Replays a recorded 16-bit mono WAV file. read() returns b"" at the end.
+    """
+
+    def __init__(self, name, path, samplerate=16000, frame_length=512):
+        self.name = name
+        self.path = path
+        self.samplerate = samplerate
+        self.frame_length = frame_length
+        self.wav = None
+
+    def start(self):
+        wav = wave.open(self.path, "rb")
+        if wav.getnchannels() != 1 or wav.getsampwidth() != 2 or wav.getframerate() != self.samplerate:
+            wav.close()
+            raise ValueError(f"{self.path} must be 16-bit mono PCM at {self.samplerate} Hz")
+        self.wav = wav
+
+    def read(self, frames):
+        if self.wav is None:
+            return b"", False
+        return self.wav.readframes(frames), False
+
+    def close(self):
+        if self.wav is not None:
+            self.wav.close()
+            self.wav = None
+
+
+def parse_devices(spec: str, samplerate=16000, frame_length=512):
+    """
+    Build sources from a spec like "kitchen=3,office=USB Mic,test=file:rec.wav".
+    A bare entry without "=" is used as both name and device.
+    """
+    sources = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, _, target = entry.partition("=")
+        name = name.strip()
+        target = target.strip() or name
+        if target.startswith("file:"):
+            sources.append(WavFileSource(name, target[5:], samplerate, frame_length))
+        else:
+            device = int(target) if target.isdigit() else target
+            sources.append(MicrophoneSource(name, device, samplerate, frame_length))
+    return sources
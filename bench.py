@@ -0,0 +1,459 @@
+"""
+Benchmarks for JARVIS internals.
+
+    python bench.py transcript --messages 100000
+    python bench.py plugins
+    python bench.py devices --wav recording.wav --devices 1,2,4,8
+    python bench.py offload --wav recording.wav
+    python bench.py worker-memory
+
+Each mode runs in its own subprocess so peak RSS is not shared between them.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+
+def rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def current_rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return rss_mb()
+
+
+def process_rss_mb(pid):
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+def report(name, latencies, extra=""):
+    rss = rss_mb()
+    rss_text = f"{rss:.1f} MB" if rss is not None else "n/a"
+    print(
+        f"{name:<12} total={sum(latencies):.2f}s "
+        f"p50={percentile(latencies, 50) * 1e6:.1f}us "
+        f"p99={percentile(latencies, 99) * 1e6:.1f}us "
+        f"max={max(latencies) * 1e3:.2f}ms "
+        f"peak_rss={rss_text} {extra}"
+    )
+
+
+def bench_transcript_mode(mode, messages, max_lines, per_frame):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication, QTextEdit
+
+    app = QApplication(sys.argv)
+
+    if mode == "textedit":
+        view = QTextEdit(readOnly=True)
+
+        def append(i):
+            view.append(f"<b style='color:#0ff;'>JARVIS:</b> message number {i}, sir.")
+
+        def render():
+            app.processEvents()
+
+        def summary():
+            return f"blocks={view.document().blockCount()}"
+    else:
+        from transcript import TranscriptModel, TranscriptView
+
+        model = TranscriptModel(max_lines=max_lines)
+        view = TranscriptView(model)
+
+        def append(i):
+            model.append("JARVIS", f"message number {i}, sir.")
+
+        def render():
+            model.flush()
+            app.processEvents()
+
+        def summary():
+            return f"rows={model.rowCount()}"
+
+    view.resize(900, 360)
+    view.show()
+
+    # Both views are timed the same way: the append itself plus, once every
+    # per_frame messages, the frame that renders what has been appended.
+    latencies = []
+    for i in range(messages):
+        start = time.perf_counter()
+        append(i)
+        if i % per_frame == 0:
+            render()
+        latencies.append(time.perf_counter() - start)
+    render()
+    report(mode, latencies, summary())
+
+
+def bench_transcript(args):
+    for mode in ("textedit", "list"):
+        subprocess.run([
+            sys.executable, __file__, "transcript",
+            "--mode", mode,
+            "--messages", str(args.messages),
+            "--max-lines", str(args.max_lines),
+            "--per-frame", str(args.per_frame),
+        ], check=False)
+
+
+# What jarvis_chat imported at module load before actions became plugins.
+EAGER_IMPORTS = ("subprocess", "webbrowser", "ctypes", "pyautogui", "pyperclip")
+
+
+def bench_plugins_mode(mode):
+    import importlib
+    from plugins import PluginRegistry
+
+    start = time.perf_counter()
+    registry = PluginRegistry()
+    registry.discover()
+    if mode == "eager":
+        for name in EAGER_IMPORTS:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                print(f"  {name}: {e}")
+        for plugin in registry.plugins:
+            try:
+                plugin.load()
+            except Exception as e:
+                print(f"  {plugin.name}: {e}")
+    report(mode, [time.perf_counter() - start], f"plugins={len(registry.plugins)} modules={len(sys.modules)}")
+
+
+def bench_plugins(args):
+    for mode in ("lazy", "eager"):
+        subprocess.run([sys.executable, __file__, "plugins", "--mode", mode], check=False)
+
+
+def read_wav(path):
+    import wave
+
+    with wave.open(path, "rb") as wav:
+        if wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+            raise SystemExit(f"{path} must be 16-bit mono PCM")
+        return wav.getframerate(), wav.readframes(wav.getnframes())
+
+
+FRAME_LENGTH = 512
+
+
+def bench_devices_mode(wav_path, devices, model_path, separate_models):
+    import struct
+    import threading
+    from vosk import Model, KaldiRecognizer, SetLogLevel
+
+    SetLogLevel(-1)
+    rate, audio = read_wav(wav_path)
+
+    base = current_rss_mb() or 0.0
+    shared = Model(model_path)
+    after_model = current_rss_mb() or 0.0
+
+    recognizers = []
+    detectors = []
+    for i in range(devices):
+        model = Model(model_path) if separate_models and i else shared
+        recognizers.append(KaldiRecognizer(model, rate))
+    if os.getenv("access_key"):
+        import pvporcupine
+        detectors = [pvporcupine.create(access_key=os.getenv("access_key"), keywords=["jarvis"])
+                     for _ in range(devices)]
+    after_devices = current_rss_mb() or 0.0
+
+    frame_bytes = FRAME_LENGTH * 2
+
+    def decode(i):
+        rec = recognizers[i]
+        detector = detectors[i] if detectors else None
+        for offset in range(0, len(audio) - frame_bytes + 1, frame_bytes):
+            data = audio[offset:offset + frame_bytes]
+            if detector is not None:
+                detector.process(struct.unpack_from(f"<{FRAME_LENGTH}h", data))
+            rec.AcceptWaveform(data)
+        rec.FinalResult()
+
+    threads = [threading.Thread(target=decode, args=(i,)) for i in range(devices)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start
+
+    for detector in detectors:
+        detector.delete()
+
+    audio_seconds = len(audio) / 2 / rate * devices
+    print(
+        f"devices={devices:<3} model={after_model - base:.1f}MB "
+        f"per_device={(after_devices - after_model) / devices:.1f}MB "
+        f"wall={wall:.2f}s audio={audio_seconds:.1f}s "
+        f"throughput={audio_seconds / wall:.1f}x realtime "
+        f"porcupine={'yes' if detectors else 'no'}"
+    )
+
+
+def bench_devices(args):
+    for count in args.devices.split(","):
+        cmd = [
+            sys.executable, __file__, "devices",
+            "--wav", args.wav,
+            "--model", args.model,
+            "--count", count.strip(),
+        ]
+        if args.separate_models:
+            cmd.append("--separate-models")
+        subprocess.run(cmd, check=False)
+
+
+def bench_offload_mode(mode, wav_path, model_path):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    import queue
+    import threading
+    import numpy as np
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtGui import QColor
+    from PyQt6.QtWidgets import QApplication
+    from speech_worker import FRAME_LENGTH, SAMPLE_RATE, SpeechDecoder, SpeechWorker
+
+    rate, audio = read_wav(wav_path)
+    if rate != SAMPLE_RATE:
+        raise SystemExit(f"{wav_path} must be sampled at {SAMPLE_RATE} Hz")
+    frame_bytes = FRAME_LENGTH * 2
+    frames = [audio[i:i + frame_bytes] for i in range(0, len(audio) - frame_bytes + 1, frame_bytes)]
+    access_key = os.getenv("access_key")
+
+    app = QApplication(sys.argv)
+    frame_times = []
+    decode_latencies = []
+
+    # Same per-frame work as JarvisApp.update_bars while speaking.
+    n = 40
+    xs = np.arange(n)
+    taper = np.hanning(n)
+    curr = np.zeros(n)
+
+    def on_frame():
+        frame_times.append(time.perf_counter())
+        t = time.time()
+        wave_ = (np.sin(xs * 0.3 + t * 10) + 1) * 0.5
+        rand = (np.random.rand(n) - 0.5) * taper
+        curr[:] += ((0.6 * wave_ + 0.4 * rand) * taper - curr) * 0.03
+        for h in curr:
+            QColor(0, int(255 * min(1.0, max(0.0, h))), 255)
+
+    frame_timer = QTimer()
+    frame_timer.timeout.connect(on_frame)
+    frame_timer.start(16)
+
+    def record(event):
+        if event[0] == "transcript":
+            decode_latencies.append(event[2])
+
+    if mode == "worker":
+        worker = SpeechWorker(model_path=model_path, access_key=access_key,
+                              wake_word=bool(access_key))
+        worker.start()
+        write = worker.write
+
+        def consume():
+            while worker.process is not None:
+                try:
+                    record(worker.events.get(timeout=0.1))
+                except queue.Empty:
+                    continue
+                except (EOFError, OSError):
+                    return
+    else:
+        from vosk import Model
+
+        detector = None
+        if access_key:
+            import pvporcupine
+            detector = pvporcupine.create(access_key=access_key, keywords=["jarvis"])
+        decoder = SpeechDecoder(Model(model_path), detector, SAMPLE_RATE)
+        pending = queue.Queue()
+
+        def write(data):
+            pending.put((data, time.monotonic()))
+
+        def consume():
+            while True:
+                item = pending.get()
+                if item is None:
+                    return
+                for event in decoder.feed(*item):
+                    record(event)
+
+    def feed():
+        period = FRAME_LENGTH / SAMPLE_RATE
+        next_at = time.perf_counter()
+        for frame in frames:
+            write(frame)
+            next_at += period
+            time.sleep(max(0.0, next_at - time.perf_counter()))
+        time.sleep(1.0)
+        QTimer.singleShot(0, app.quit)
+
+    consumer = threading.Thread(target=consume, daemon=True)
+    consumer.start()
+    threading.Thread(target=feed, daemon=True).start()
+    app.exec()
+
+    if mode == "worker":
+        worker.stop()
+    else:
+        pending.put(None)
+        consumer.join()
+
+    intervals = [b - a for a, b in zip(frame_times, frame_times[1:])]
+    jitter = float(np.std(intervals)) if intervals else 0.0
+    print(
+        f"{mode:<8} frames={len(frame_times)} "
+        f"frame_p50={percentile(intervals, 50) * 1e3:.1f}ms "
+        f"frame_p99={percentile(intervals, 99) * 1e3:.1f}ms "
+        f"frame_max={max(intervals, default=0.0) * 1e3:.1f}ms "
+        f"jitter={jitter * 1e3:.2f}ms "
+        f"transcripts={len(decode_latencies)} "
+        f"decode_p50={percentile(decode_latencies, 50) * 1e3:.1f}ms "
+        f"decode_p99={percentile(decode_latencies, 99) * 1e3:.1f}ms "
+        f"porcupine={'yes' if access_key else 'no'}"
+    )
+
+
+def bench_offload(args):
+    for mode in ("inproc", "worker"):
+        subprocess.run([
+            sys.executable, __file__, "offload",
+            "--wav", args.wav,
+            "--model", args.model,
+            "--mode", mode,
+        ], check=False)
+
+
+ENTRY_POINTS = {"app": "app.py", "chat": "jarvis_chat.py"}
+
+
+def bench_worker_memory_mode(entry, model_path):
+    from speech_worker import SpeechWorker
+
+    if entry != "bench":
+        # Spawned children re-run the parent's main module, so make the
+        # worker start up exactly as it does under `python app.py` or
+        # `python jarvis_chat.py`.
+        sys.modules["__main__"].__file__ = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), ENTRY_POINTS[entry]
+        )
+        os.environ["JARVIS_SPEECH_WORKER"] = "1"
+
+    access_key = os.getenv("access_key")
+    worker = SpeechWorker(model_path=model_path, access_key=access_key, wake_word=bool(access_key))
+    start = time.perf_counter()
+    worker.start()
+    ready = time.perf_counter() - start
+    rss = process_rss_mb(worker.process.pid)
+    worker.stop()
+    rss_text = f"{rss:.1f} MB" if rss is not None else "n/a"
+    print(f"entry={entry:<6} worker_rss={rss_text} startup={ready:.2f}s")
+
+
+def bench_worker_memory(args):
+    for entry in ("bench", "app", "chat"):
+        subprocess.run([
+            sys.executable, __file__, "worker-memory",
+            "--model", args.model,
+            "--entry", entry,
+        ], check=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JARVIS benchmarks")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    p = sub.add_parser("transcript", help="QTextEdit vs. bounded transcript list view")
+    p.add_argument("--messages", type=int, default=100000)
+    p.add_argument("--max-lines", type=int, default=2000)
+    p.add_argument("--per-frame", type=int, default=10,
+                   help="messages arriving between two rendered frames")
+    p.add_argument("--mode", choices=("textedit", "list"))
+
+    p = sub.add_parser("plugins", help="startup cost of lazy vs. eager plugin loading")
+    p.add_argument("--mode", choices=("lazy", "eager"))
+
+    p = sub.add_parser("devices", help="memory and decode throughput as audio devices scale")
+    p.add_argument("--wav", required=True, help="16-bit mono recording to decode on every device")
+    p.add_argument("--model", default="model")
+    p.add_argument("--devices", default="1,2,4,8")
+    p.add_argument("--count", type=int)
+    p.add_argument("--separate-models", action="store_true",
+                   help="load one Vosk model per device, as separate processes would")
+
+    p = sub.add_parser("offload", help="GUI frame jitter and decode latency, in-process vs. worker")
+    p.add_argument("--wav", required=True, help="16 kHz 16-bit mono recording, replayed in real time")
+    p.add_argument("--model", default="model")
+    p.add_argument("--mode", choices=("inproc", "worker"))
+
+    p = sub.add_parser("worker-memory", help="speech worker RSS per entry point (bench.py, app.py, jarvis_chat.py)")
+    p.add_argument("--model", default="model")
+    p.add_argument("--entry", choices=("bench", "app", "chat"))
+
+    args = parser.parse_args()
+    if args.bench == "transcript":
+        if args.mode:
+            bench_transcript_mode(args.mode, args.messages, args.max_lines, args.per_frame)
+        else:
+            bench_transcript(args)
+    elif args.bench == "plugins":
+        if args.mode:
+            bench_plugins_mode(args.mode)
+        else:
+            bench_plugins(args)
+    elif args.bench == "devices":
+        if args.count:
+            bench_devices_mode(args.wav, args.count, args.model, args.separate_models)
+        else:
+            bench_devices(args)
+    elif args.bench == "offload":
+        if args.mode:
+            bench_offload_mode(args.mode, args.wav, args.model)
+        else:
+            bench_offload(args)
+    elif args.bench == "worker-memory":
+        if args.entry:
+            bench_worker_memory_mode(args.entry, args.model)
+        else:
+            bench_worker_memory(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Append-only command history in SQLite.
+
+Every handled command is stored with its transcript, matched intent
+(plugin name, "gemini" or "exit"), outcome ("ok", or "error" when the action
+or Gemini could not carry it out) and per-stage latencies:
+
+    stt_ms     wake word detected -> transcript returned, in every mode; this
+               includes the "Yes, sir?" acknowledgement and the time spoken
+    match_ms   intent matching in the plugin registry
+    action_ms  running the plugin or the Gemini request, including speech
+
+Transcripts are indexed with FTS5 when the SQLite build supports it.
+
+    python history.py report
+    python history.py search "open spotify"
+"""
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+DB_PATH = os.getenv("JARVIS_HISTORY_DB", "history.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS commands (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    device TEXT,
+    transcript TEXT NOT NULL,
+    intent TEXT,
+    outcome TEXT,
+    stt_ms REAL,
+    match_ms REAL,
+    action_ms REAL
+);
+CREATE INDEX IF NOT EXISTS commands_transcript ON commands(transcript);
+CREATE INDEX IF NOT EXISTS commands_intent ON commands(intent);
+CREATE INDEX IF NOT EXISTS commands_ts ON commands(ts);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS commands_fts
+    USING fts5(transcript, content='commands', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS commands_fts_insert AFTER INSERT ON commands BEGIN
+    INSERT INTO commands_fts(rowid, transcript) VALUES (new.id, new.transcript);
+END;
+"""
+
+TOTAL_MS = "(COALESCE(stt_ms, 0) + COALESCE(match_ms, 0) + COALESCE(action_ms, 0))"
+
+
+class CommandHistory:
+
+    def __init__(self, path: str = DB_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        try:
+            self.conn.executescript(FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError:
+            self.fts = False
+        self.conn.commit()
+
+    def _query(self, sql, params=()):
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def record(self, transcript: str, intent: str, outcome: str,
+               stt_ms=None, match_ms=None, action_ms=None, device=None):
+        with self.lock:
+            self.conn.execute(
+                "INSERT INTO commands (ts, device, transcript, intent, outcome, stt_ms, match_ms, action_ms) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), device, transcript, intent, outcome, stt_ms, match_ms, action_ms),
+            )
+            self.conn.commit()
+
+    def recent(self, limit: int = 20):
+        return self._query(
+            "SELECT ts, device, transcript, intent, outcome, stt_ms, match_ms, action_ms "
+            "FROM commands ORDER BY id DESC LIMIT ?",
+            (limit,),
+        )
+
+    def search(self, text: str, limit: int = 20):
+        """
+        Commands whose transcript contains every word of text, newest first.
+        """
+        words = text.split()
+        if not words:
+            return []
+        if self.fts:
+            match = " ".join('"%s"' % w.replace('"', '""') for w in words)
+            return self._query(
+                "SELECT c.ts, c.device, c.transcript, c.intent, c.outcome, c.stt_ms, c.match_ms, c.action_ms "
+                "FROM commands_fts f JOIN commands c ON c.id = f.rowid "
+                "WHERE commands_fts MATCH ? ORDER BY c.id DESC LIMIT ?",
+                (match, limit),
+            )
+        where = " AND ".join("transcript LIKE ?" for _ in words)
+        return self._query(
+            "SELECT ts, device, transcript, intent, outcome, stt_ms, match_ms, action_ms "
+            f"FROM commands WHERE {where} ORDER BY id DESC LIMIT ?",
+            tuple(f"%{w}%" for w in words) + (limit,),
+        )
+
+    def most_frequent(self, limit: int = 10):
+        """
+        (transcript, intent, count, avg_total_ms) for the most repeated commands.
+        """
+        return self._query(
+            f"SELECT transcript, intent, COUNT(*) AS n, AVG({TOTAL_MS}) "
+            "FROM commands GROUP BY transcript, intent ORDER BY n DESC, MAX(id) DESC LIMIT ?",
+            (limit,),
+        )
+
+    def slowest(self, limit: int = 10):
+        """
+        (transcript, intent, avg_total_ms, avg_stt_ms, avg_match_ms, avg_action_ms, count),
+        slowest on average first.
+        """
+        return self._query(
+            f"SELECT transcript, intent, AVG({TOTAL_MS}) AS total, "
+            "AVG(stt_ms), AVG(match_ms), AVG(action_ms), COUNT(*) "
+            "FROM commands GROUP BY transcript, intent ORDER BY total DESC LIMIT ?",
+            (limit,),
+        )
+
+    def hot_commands(self, limit: int = 50):
+        return [row[0] for row in self._query(
+            "SELECT transcript FROM commands GROUP BY transcript "
+            "ORDER BY COUNT(*) DESC, MAX(id) DESC LIMIT ?",
+            (limit,),
+        )]
+
+    def report(self, limit: int = 10) -> str:
+        lines = ["Most frequent commands:"]
+        for transcript, intent, count, total in self.most_frequent(limit):
+            lines.append(f"  {count:>5}x  {total or 0:>8.0f} ms  [{intent}] {transcript}")
+        lines.append("")
+        lines.append("Slowest commands (avg total / stt / match / action ms):")
+        for transcript, intent, total, stt, match, action, count in self.slowest(limit):
+            lines.append(
+                f"  {total or 0:>8.0f} / {stt or 0:.0f} / {match or 0:.2f} / {action or 0:.0f}"
+                f"  ({count}x) [{intent}] {transcript}"
+            )
+        return "\n".join(lines)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ("report", "search", "recent"):
+        print("usage: python history.py report | recent | search <text>")
+        return
+    history = CommandHistory()
+    try:
+        if sys.argv[1] == "report":
+            print(history.report())
+            return
+        if sys.argv[1] == "search":
+            rows = history.search(" ".join(sys.argv[2:]))
+        else:
+            rows = history.recent()
+        for ts, device, transcript, intent, outcome, stt, match, action in rows:
+            when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+            room = f" {device}" if device else ""
+            print(f"{when}{room}  [{intent}/{outcome}] {transcript}")
+    finally:
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,42 @@
 import struct
 import json
+import queue
+import threading
+import time
 import requests
 import pyttsx3
 import sounddevice as sd
 import pvporcupine
 from vosk import Model, KaldiRecognizer
-import subprocess
-import webbrowser
-import datetime
 import os
-import ctypes
-import pyautogui
-import pyperclip
-import time
 from dotenv import load_dotenv
 
-engine = pyttsx3.init()
-voices = engine.getProperty('voices')
-for v in voices:
-    if 'david' in v.name.lower():
-        engine.setProperty('voice', v.id)
-        break
-engine.setProperty('rate', 206)
-engine.setProperty('volume', 1.0)
+from audio_sources import parse_devices
+from history import CommandHistory
+from plugins import PluginRegistry
+from speech_worker import SpeechWorker
+
+# pyttsx3 is not thread-safe; every listener shares this one engine.
+speech_lock = threading.Lock()
+engine = None
+
+def init_engine():
+    """
+    Create the TTS engine on first use rather than at import, so processes
+    that only import this module (e.g. the spawned speech worker) skip it.
+    Call with speech_lock held.
+    """
+    global engine
+    if engine is None:
+        engine = pyttsx3.init()
+        voices = engine.getProperty('voices')
+        for v in voices:
+            if 'david' in v.name.lower():
+                engine.setProperty('voice', v.id)
+                break
+        engine.setProperty('rate', 206)
+        engine.setProperty('volume', 1.0)
+    return engine
 
 def speak(text: str, display_callback=None, visualizer_callback=None):
     if visualizer_callback:
@@ -36,8 +50,10 @@ def speak(text: str, display_callback=None, visualizer_callback=None):
         except Exception:
             pass
     try:
-        engine.say(text)
-        engine.runAndWait()
+        with speech_lock:
+            tts = init_engine()
+            tts.say(text)
+            tts.runAndWait()
     except Exception as e:
         if display_callback:
             try:
@@ -60,12 +76,13 @@ def ask_jarvis(prompt: str, display_callback=None, visualizer_callback=None):
     """
     Send the prompt to Gemini API (Generative Language) and get a response.
     Forward status and reply via display_callback, and speak via speak().
+    Returns False if no reply could be obtained.
     """
     if GEMINI_API_KEY is None:
         err = "GEMINI_API_KEY is not set. Cannot contact Gemini API."
         print(err)
         speak(err, display_callback=display_callback, visualizer_callback=visualizer_callback)
-        return
+        return False
 
     url = (
         "https://generativelanguage.googleapis.com/"
@@ -96,7 +113,7 @@ def ask_jarvis(prompt: str, display_callback=None, visualizer_callback=None):
         err = f"Error contacting Gemini API: {e}"
         print(err)
         speak(err, display_callback=display_callback, visualizer_callback=visualizer_callback)
-        return
+        return False
 
     try:
         data = resp.json()
@@ -104,73 +121,89 @@ def ask_jarvis(prompt: str, display_callback=None, visualizer_callback=None):
         err = "Sorry, I got a non-JSON response from Gemini."
         speak(err, display_callback=display_callback, visualizer_callback=visualizer_callback)
         print("Non-JSON response:", resp.text)
-        return
+        return False
 
     if resp.status_code != 200:
         err_msg = data.get("error", {}).get("message", resp.text)
         err = f"Sorry, Gemini returned an error: {err_msg}"
         speak(err, display_callback=display_callback, visualizer_callback=visualizer_callback)
-        return
+        return False
 
     candidates = data.get("candidates")
     if not candidates or not isinstance(candidates, list):
         err = "Sorry, I didn’t receive any candidates from Gemini."
         speak(err, display_callback=display_callback, visualizer_callback=visualizer_callback)
-        return
+        return False
 
     first = candidates[0].get("content", {})
     parts = first.get("parts")
     if not parts or not isinstance(parts, list):
         err = "Sorry, unexpected response format from Gemini."
         speak(err, display_callback=display_callback, visualizer_callback=visualizer_callback)
-        return
+        return False
 
     reply = parts[0].get("text")
     if not isinstance(reply, str):
         err = "Sorry, I couldn't read the assistant’s reply."
         speak(err, display_callback=display_callback, visualizer_callback=visualizer_callback)
-        return
+        return False
 
     print("\nJARVIS:", reply)
-    if display_callback:
-        try:
-            display_callback(reply)
-        except Exception:
-            pass
     speak(reply, display_callback=display_callback, visualizer_callback=visualizer_callback)
+    return True
 
 
-try:
-    vosk_model = Model("model")
-except Exception as e:
-    print(f"Failed to load VOSK model: {e}")
-    vosk_model = None
+# With the speech worker enabled, Vosk and Porcupine live in the worker process.
+SPEECH_WORKER = os.getenv("JARVIS_SPEECH_WORKER", "").lower() in ("1", "true", "yes")
+# With several devices, run_devices creates one Porcupine handle per source.
+AUDIO_DEVICES = os.getenv("JARVIS_AUDIO_DEVICES")
 
-porc = None
-try:
-    porc = pvporcupine.create(
+vosk_model = None
+if not SPEECH_WORKER:
+    try:
+        vosk_model = Model("model")
+    except Exception as e:
+        print(f"Failed to load VOSK model: {e}")
+        vosk_model = None
+
+def create_porcupine():
+    return pvporcupine.create(
         access_key=os.getenv("access_key"),
         keywords=["jarvis"]
     )
-except Exception as e:
-    print(f"Failed to initialize Porcupine wake-word detector: {e}")
-    porc = None
 
-def handle_command(wav_stream):
+porc = None
+if not SPEECH_WORKER and not AUDIO_DEVICES:
+    try:
+        porc = create_porcupine()
+    except Exception as e:
+        print(f"Failed to initialize Porcupine wake-word detector: {e}")
+        porc = None
+
+def handle_command(wav_stream, detector=None, recognizer=None):
+    """
+    Transcribe one command from wav_stream. detector and recognizer default to
+    the module Porcupine handle and a fresh KaldiRecognizer on the shared model.
+    """
     if vosk_model is None:
         print("VOSK model not loaded; cannot recognize speech.")
         return ""
 
-    rec = KaldiRecognizer(vosk_model, porc.sample_rate if porc else 16000)
+    detector = detector or porc
+    if recognizer is None:
+        rec = KaldiRecognizer(vosk_model, detector.sample_rate if detector else 16000)
+    else:
+        rec = recognizer
+        rec.Reset()
     print("[Listening for command…]")
     while True:
         try:
-            data, _ = wav_stream.read(porc.frame_length if porc else 4000)
+            data, _ = wav_stream.read(detector.frame_length if detector else 4000)
         except Exception as e:
             print(f"Error reading from audio stream: {e}")
             return ""
         try:
-            pcm = struct.unpack_from(f"<{porc.frame_length}h", data) if porc else None
+            pcm = struct.unpack_from(f"<{detector.frame_length}h", data) if detector else None
         except Exception:
             pcm = None
         if vosk_model and pcm is not None:
@@ -185,275 +218,326 @@ def handle_command(wav_stream):
         else:
             return ""
 
-def get_my_location():
-    try:
-        r = requests.get("http://ip-api.com/json/", timeout=3)
-        r.raise_for_status()
-        loc = r.json()
-        return (
-            loc.get("city"),
-            loc.get("regionName"),
-            loc.get("lat"),
-            loc.get("lon")
-        )
-    except Exception as e:
-        print("Location lookup failed:", e)
-        return (None, None, None, None)
+plugin_registry = PluginRegistry()
+
+HOT_COMMANDS = 50
 
-def tell_weather(display_callback=None, visualizer_callback=None):
+history = None
+
+def warm_hot_commands():
     """
-    Fetch current weather via WeatherAPI and speak/display it.
+    Preload the plugins behind the most frequent past commands and let the
+    registry resolve those exact commands without scanning.
     """
-    WEATHER_API_KEY = os.getenv("weather_api_key")
-    if WEATHER_API_KEY is None:
-        err = "weather_api_key not set; cannot fetch weather."
-        speak(err, display_callback=display_callback, visualizer_callback=visualizer_callback)
-        return
-
-    city, region, lat, lon = get_my_location()
-    if city:
-        query = city
-    elif lat is not None and lon is not None:
-        query = f"{lat},{lon}"
-    else:
-        speak("Sorry, I couldn't figure out your location, sir.",
-              display_callback=display_callback, visualizer_callback=visualizer_callback)
+    if history is None:
         return
-
-    url = (
-        f"http://api.weatherapi.com/v1/current.json"
-        f"?key={WEATHER_API_KEY}"
-        f"&q={query}"
-        f"&aqi=no"
-    )
-    if display_callback:
-        try:
-            display_callback(f"(Fetching weather for {query})")
-        except Exception:
-            pass
-
     try:
-        resp = requests.get(url, timeout=5)
-        data = resp.json()
+        hot = plugin_registry.warm(history.hot_commands(HOT_COMMANDS))
+        if hot:
+            print(f"Warmed {len(hot)} frequent commands.")
     except Exception as e:
-        print("WeatherAPI request failed:", e)
-        speak("Sorry, I couldn't connect to the weather service, sir.",
-              display_callback=display_callback, visualizer_callback=visualizer_callback)
-        return
-
-    if resp.status_code == 200 and "current" in data:
-        temp_c = data["current"].get("temp_c")
-        cond = data["current"].get("condition", {}).get("text", "")
-        loc_name = data.get("location", {}).get("name", "")
-        msg = f"The weather in {loc_name} is {cond} with a temperature of {temp_c} degrees Celsius, sir."
-        speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
-    elif "error" in data:
-        msg = data["error"].get("message", "an unknown error")
-        speak(f"WeatherAPI error: {msg}, sir.",
-              display_callback=display_callback, visualizer_callback=visualizer_callback)
-    else:
-        speak("Sorry, I couldn't fetch the weather, sir.",
-              display_callback=display_callback, visualizer_callback=visualizer_callback)
-
-def tell_time(display_callback=None, visualizer_callback=None):
-    now = datetime.datetime.now()
-    timestr = now.strftime('%I:%M %p')
-    msg = f"The current time is {timestr}, sir."
-    speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+        print(f"Failed to warm frequent commands: {e}")
 
-def take_screenshot(display_callback=None, visualizer_callback=None):
+def record_command(cmd, intent, outcome, stt_ms=None, match_ms=None, action_ms=None, device=None):
+    if history is None:
+        return
     try:
-        ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        pdir = os.path.join(os.environ.get('USERPROFILE', ''), 'Pictures')
-        if not pdir:
-            raise RuntimeError("USERPROFILE not set")
-        os.makedirs(pdir, exist_ok=True)
-        path = os.path.join(pdir, f'screenshot_{ts}.png')
-        pyautogui.screenshot().save(path)
-        msg = f"Screenshot saved: {path}, sir."
-        speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+        history.record(cmd, intent, outcome, stt_ms=stt_ms, match_ms=match_ms,
+                       action_ms=action_ms, device=device)
     except Exception as e:
-        print(f"Screenshot error: {e}")
-        speak(f"Failed to take screenshot: {e}", display_callback=display_callback,
-              visualizer_callback=visualizer_callback)
+        print(f"Failed to record command: {e}")
 
-def empty_recycle_bin(display_callback=None, visualizer_callback=None):
-    try:
-        ctypes.windll.shell32.SHEmptyRecycleBinW(None, None, 0)
-        msg = "Recycle bin emptied, sir."
-        speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
-    except Exception as e:
-        print(f"Empty recycle bin error: {e}")
-        speak(f"Failed to empty recycle bin: {e}", display_callback=display_callback,
-              visualizer_callback=visualizer_callback)
+def handle_action(command: str, display_callback=None, visualizer_callback=None, stt_ms=None, device=None):
+    cmd = command.lower().strip()
+    if not cmd:
+        return
 
-def lock_screen(display_callback=None, visualizer_callback=None):
-    try:
-        ctypes.windll.user32.LockWorkStation()
-    except Exception as e:
-        print(f"Lock screen error: {e}")
-        speak(f"Failed to lock screen: {e}", display_callback=display_callback,
-              visualizer_callback=visualizer_callback)
-
-def open_application(name: str, display_callback=None, visualizer_callback=None):
-    apps = {
-        'browser': lambda: webbrowser.open('https://www.google.com'),
-        'youtube': lambda: webbrowser.open('https://www.youtube.com'),
-        'notepad': lambda: subprocess.Popen(['notepad']),
-        'calculator': lambda: subprocess.Popen(['calc']),
-        'terminal': lambda: subprocess.Popen(['wt']),
-        'spotify': lambda: subprocess.Popen([
-            os.path.expandvars(r'%USERPROFILE%\AppData\Roaming\Spotify\Spotify.exe')
-        ]),
-        'vscode': lambda: subprocess.Popen([
-            os.path.expandvars(r'%LOCALAPPDATA%\Programs\Microsoft VS Code\Code.exe')
-        ]),
-        'epic': lambda: subprocess.Popen([
-            os.path.expandvars(r'%ProgramFiles(x86)%\Epic Games\Launcher\Portal\Binaries\Win32\EpicGamesLauncher.exe')
-        ]),
-        'dashboard': lambda: launch_dashboard(display_callback=display_callback, visualizer_callback=visualizer_callback),
-        'teams': lambda: subprocess.Popen([
-            os.path.expandvars(r'%LOCALAPPDATA%\Microsoft\Teams\current\Teams.exe')
-        ]),
-    }
+    start = time.perf_counter()
+    plugin = plugin_registry.match(cmd)
+    match_ms = (time.perf_counter() - start) * 1000
+    intent = plugin.name if plugin else "gemini"
+    ok = False
+    start = time.perf_counter()
     try:
-        action = apps.get(name)
-        if action:
-            action()
-            msg = f"Opening {name}, sir."
-            speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+        if plugin is None:
+            ok = ask_jarvis(cmd, display_callback=display_callback, visualizer_callback=visualizer_callback)
         else:
-            msg = "I don't know that application, sir."
-            speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+            ok = plugin_registry.run(plugin, cmd, speak, display_callback=display_callback,
+                                     visualizer_callback=visualizer_callback)
+    finally:
+        outcome = "ok" if ok else "error"
+        action_ms = (time.perf_counter() - start) * 1000
+        record_command(cmd, intent, outcome, stt_ms=stt_ms, match_ms=match_ms,
+                       action_ms=action_ms, device=device)
+
+EXIT_WORDS = ("exit", "quit", "goodbye", "stop", "bye")
+
+def device_display(name: str, display_callback=None):
+    if display_callback is None:
+        return None
+    return lambda msg: display_callback(f"[{name}] {msg}")
+
+def listen_device(source, detector, dispatch_queue, display_callback=None, visualizer_callback=None):
+    """
+    Wake-word + STT loop for one audio source. The wake acknowledgement and
+    recognized commands are queued for the shared dispatcher, so this thread
+    keeps consuming audio while another room is being answered.
+    """
+    rec = KaldiRecognizer(vosk_model, detector.sample_rate)
+    frame_bytes = detector.frame_length * 2
+    try:
+        while True:
+            data, _ = source.read(detector.frame_length)
+            if len(data) < frame_bytes:
+                print(f"Audio source {source.name} ended.")
+                break
+            pcm = struct.unpack_from(f"<{detector.frame_length}h", data)
+            if detector.process(pcm) >= 0:
+                print(f"\n[Wake-word detected on {source.name}!]")
+                dispatch_queue.put((source.name, None, None))
+                start = time.perf_counter()
+                cmd = handle_command(source, detector=detector, recognizer=rec)
+                stt_ms = (time.perf_counter() - start) * 1000
+                if not cmd:
+                    continue
+                dispatch_queue.put((source.name, cmd, stt_ms))
+                if any(w in cmd for w in EXIT_WORDS):
+                    break
     except Exception as e:
-        print(f"Error opening {name}: {e}")
-        speak(f"Something went wrong opening {name}, sir.",
-              display_callback=display_callback, visualizer_callback=visualizer_callback)
-
-def handle_action(command: str, display_callback=None, visualizer_callback=None):
-    cmd = command.lower().strip()
-    if not cmd:
-        return
-    if any(k in cmd for k in ('weather', 'temperature', 'forecast')):
-        tell_weather(display_callback=display_callback, visualizer_callback=visualizer_callback)
-        return
+        print(f"Error in listener {source.name}: {e}")
+        if display_callback:
+            try:
+                display_callback(f"Error in listener: {e}")
+            except Exception:
+                pass
+    finally:
+        source.close()
+        try:
+            detector.delete()
+        except Exception:
+            pass
 
-    if 'downloads' in cmd:
-        path = os.path.join(os.environ.get('USERPROFILE', ''), 'Downloads')
+def dispatch_commands(dispatch_queue, display_callback=None, visualizer_callback=None):
+    """
+    Run queued (device, command, stt_ms) items one at a time until a None
+    sentinel. A None command is a wake-word acknowledgement.
+    """
+    while True:
+        item = dispatch_queue.get()
+        if item is None:
+            return
+        name, cmd, stt_ms = item
+        room_display = device_display(name, display_callback)
+        if cmd is None:
+            speak("Yes, sir?", visualizer_callback=visualizer_callback)
+            continue
+        if any(w in cmd for w in EXIT_WORDS):
+            record_command(cmd, "exit", "ok", stt_ms=stt_ms, device=name)
+            speak("Goodbye, sir.", display_callback=room_display, visualizer_callback=visualizer_callback)
+            continue
         try:
-            subprocess.Popen(['explorer', path])
-            msg = "Opening Downloads folder, sir."
-            speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+            handle_action(cmd, display_callback=room_display, visualizer_callback=visualizer_callback,
+                          stt_ms=stt_ms, device=name)
         except Exception as e:
-            print(f"Open Downloads error: {e}")
-            speak(f"Failed to open Downloads: {e}", display_callback=display_callback,
-                  visualizer_callback=visualizer_callback)
+            print(f"Error handling command from {name}: {e}")
+
+def run_devices(sources, display_callback=None, visualizer_callback=None):
+    """
+    Listen on several audio sources at once. Each source gets its own
+    Porcupine handle and KaldiRecognizer; all share the loaded Vosk model,
+    one dispatcher thread and the TTS engine.
+    """
+    if vosk_model is None:
+        print("VOSK model not loaded; cannot listen on devices.")
+        if display_callback:
+            try:
+                display_callback("VOSK model not loaded.")
+            except Exception:
+                pass
         return
-    if 'documents' in cmd:
-        path = os.path.join(os.environ.get('USERPROFILE', ''), 'Documents')
+
+    dispatch_queue = queue.Queue()
+    dispatcher = threading.Thread(
+        target=dispatch_commands,
+        args=(dispatch_queue,),
+        kwargs={"display_callback": display_callback, "visualizer_callback": visualizer_callback},
+        daemon=True,
+    )
+    dispatcher.start()
+
+    listeners = []
+    for source in sources:
+        room_display = device_display(source.name, display_callback)
         try:
-            subprocess.Popen(['explorer', path])
-            msg = "Opening Documents folder, sir."
-            speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+            detector = create_porcupine()
         except Exception as e:
-            print(f"Open Documents error: {e}")
-            speak(f"Failed to open Documents: {e}", display_callback=display_callback,
-                  visualizer_callback=visualizer_callback)
-        return
-    if 'desktop' in cmd:
-        path = os.path.join(os.environ.get('USERPROFILE', ''), 'Desktop')
+            print(f"Failed to initialize Porcupine for {source.name}: {e}")
+            continue
+        source.samplerate = detector.sample_rate
+        source.frame_length = detector.frame_length
         try:
-            subprocess.Popen(['explorer', path])
-            msg = "Opening Desktop folder, sir."
-            speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+            source.start()
         except Exception as e:
-            print(f"Open Desktop error: {e}")
-            speak(f"Failed to open Desktop: {e}", display_callback=display_callback,
-                  visualizer_callback=visualizer_callback)
-        return
+            print(f"Failed to open audio source {source.name}: {e}")
+            if room_display:
+                try:
+                    room_display(f"Audio stream error: {e}")
+                except Exception:
+                    pass
+            detector.delete()
+            continue
+        listener = threading.Thread(
+            target=listen_device,
+            args=(source, detector, dispatch_queue),
+            kwargs={"display_callback": room_display, "visualizer_callback": visualizer_callback},
+            daemon=True,
+        )
+        listener.start()
+        listeners.append(listener)
+        print(f"Listening on {source.name}.")
 
-    if any(k in cmd for k in ('screenshot', 'screen shot', 'screen capture', 'screen grab', 'take a picture')):
-        take_screenshot(display_callback=display_callback, visualizer_callback=visualizer_callback)
-        return
+    if not listeners:
+        print("No audio devices could be started.")
+        if display_callback:
+            try:
+                display_callback("No audio devices could be started.")
+            except Exception:
+                pass
 
-    if 'recycle' in cmd:
-        empty_recycle_bin(display_callback=display_callback, visualizer_callback=visualizer_callback)
+    try:
+        for listener in listeners:
+            listener.join()
+    except KeyboardInterrupt:
+        print("\nInterrupted by user")
+        for source in sources:
+            source.close()
+    finally:
+        dispatch_queue.put(None)
+        dispatcher.join()
+
+WORKER_POLL_INTERVAL = 1.0
+
+def run_speech_worker(display_callback=None, visualizer_callback=None):
+    """
+    Like run_jarvis, but wake-word detection and transcription run in a
+    SpeechWorker process fed from the microphone callback.
+    """
+    access_key = os.getenv("access_key")
+    if not access_key:
+        print("Wake-word detector not initialized. Exiting run_jarvis.")
+        if display_callback:
+            try:
+                display_callback("Wake-word detector not initialized.")
+            except Exception:
+                pass
         return
 
-    if any(k in cmd for k in ('lock', 'lock screen', 'lock the screen', 'close the screen')):
-        lock_screen(display_callback=display_callback, visualizer_callback=visualizer_callback)
+    worker = SpeechWorker(model_path="model", access_key=access_key)
+    try:
+        worker.start()
+    except Exception as e:
+        print(f"Failed to start speech worker: {e}")
+        if display_callback:
+            try:
+                display_callback(f"Speech worker error: {e}")
+            except Exception:
+                pass
         return
 
-    if any(k in cmd for k in ('clipboard', 'search this', 'search clipboard')):
-        speak("Searching the clipboard, sir.", display_callback=display_callback, visualizer_callback=visualizer_callback)
-        time.sleep(1)
-        try:
-            q = pyperclip.paste().strip()
-        except Exception:
-            q = ""
-        if q:
-            webbrowser.open(f"https://www.google.com/search?q={q.replace(' ', '+')}")
-            msg = "Here are the search results, sir."
-            speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
-        else:
-            speak("Clipboard is empty, sir.", display_callback=display_callback, visualizer_callback=visualizer_callback)
-        return
+    def on_audio(indata, frames, time_info, status):
+        worker.write(bytes(indata))
 
-    if any(k in cmd for k in ('open', 'launch', 'start')):
-        aliases = {
-            'browser': ['browser', 'chrome', 'firefox', 'edge', 'google', 'web'],
-            'youtube': ['youtube', 'yt', 'you tube', 'tube'],
-            'notepad': ['notepad', 'notes'],
-            'calculator': ['calc', 'calculator'],
-            'terminal': ['terminal', 'cmd', 'powershell', 'shell'],
-            'spotify': ['spotify', 'music'],
-            'vscode': ['vscode', 'code', 'visual studio code'],
-            'epic': ['epic', 'epic games'],
-            'dashboard': ['dashboard', 'home', 'panel'],
-            'teams': ['teams', 'microsoft teams', 'ms teams'],
-        }
-        for name, keys in aliases.items():
-            if any(k in cmd for k in keys):
-                open_application(name, display_callback=display_callback, visualizer_callback=visualizer_callback)
-                return
-        speak("Which application should I open, sir?", display_callback=display_callback,
-              visualizer_callback=visualizer_callback)
-        return
+    try:
+        with sd.RawInputStream(
+            samplerate=worker.sample_rate,
+            blocksize=worker.frame_length,
+            dtype="int16",
+            channels=1,
+            callback=on_audio,
+        ):
+            while True:
+                try:
+                    event = worker.events.get(timeout=WORKER_POLL_INTERVAL)
+                except queue.Empty:
+                    if worker.process is not None and worker.process.is_alive():
+                        continue
+                    print("Speech worker exited.")
+                    if display_callback:
+                        try:
+                            display_callback("Speech worker exited.")
+                        except Exception:
+                            pass
+                    break
+                kind = event[0]
+                if kind == "error":
+                    raise RuntimeError(event[1])
+                if kind == "wake":
+                    print(f"\n[Wake-word detected!] ({event[1] * 1000:.0f} ms)")
+                    speak("Yes, sir?", visualizer_callback=visualizer_callback)
+                    continue
+                if kind != "transcript":
+                    continue
+                cmd = event[1]
+                print(f"You said: {cmd} ({event[2] * 1000:.0f} ms decode)")
+                if not cmd:
+                    continue
+                stt_ms = event[3] * 1000
+                if any(w in cmd for w in EXIT_WORDS):
+                    record_command(cmd, "exit", "ok", stt_ms=stt_ms)
+                    speak("Goodbye, sir.", display_callback=display_callback, visualizer_callback=visualizer_callback)
+                    break
+                handle_action(cmd, display_callback=display_callback, visualizer_callback=visualizer_callback,
+                              stt_ms=stt_ms)
+    except KeyboardInterrupt:
+        print("\nInterrupted by user")
+    except Exception as e:
+        print(f"Error in speech worker loop: {e}")
+        if display_callback:
+            try:
+                display_callback(f"Error in main loop: {e}")
+            except Exception:
+                pass
+    finally:
+        worker.stop()
 
-    if 'time' in cmd:
-        tell_time(display_callback=display_callback, visualizer_callback=visualizer_callback)
-        return
+initialized = False
 
-    if cmd.startswith("search "):
-        query = cmd.replace("search", "", 1).strip()
-        if query:
-            msg = f"Searching for {query}, sir."
-            speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
-            webbrowser.open(f"https://www.google.com/search?q={query.replace(' ', '+')}")
-            speak("Here are the search results, sir.", display_callback=display_callback, visualizer_callback=visualizer_callback)
-        else:
-            speak("What would you like me to search for, sir?", display_callback=display_callback,
-                  visualizer_callback=visualizer_callback)
+def init_jarvis():
+    """
+    One-time setup for a running assistant: the TTS engine, plugin
+    discovery, the command history and warming its frequent commands.
+    Kept out of module import so the spawned speech worker, which re-runs
+    the parent's main module, does not repeat it.
+    """
+    global initialized, history
+    if initialized:
         return
-
-    ask_jarvis(cmd, display_callback=display_callback, visualizer_callback=visualizer_callback)
-
-def launch_dashboard(display_callback=None, visualizer_callback=None):
+    initialized = True
+    with speech_lock:
+        try:
+            init_engine()
+        except Exception as e:
+            print(f"Failed to initialize TTS engine: {e}")
+    plugin_registry.discover()
     try:
-        ps1_path = os.path.expandvars(r"%USERPROFILE%\J.A.R.V.I.S\synq-start.ps1")
-        subprocess.Popen(["powershell", "-ExecutionPolicy", "Bypass", "-File", ps1_path])
-        time.sleep(3)
-        webbrowser.open("http://localhost:3000", new=2)
-        msg = "Dashboard launched, sir."
-        speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+        history = CommandHistory()
     except Exception as e:
-        print("Error launching dashboard:", e)
-        speak(f"Error launching dashboard: {e}", display_callback=display_callback,
-              visualizer_callback=visualizer_callback)
+        print(f"Command history unavailable: {e}")
+        history = None
+    threading.Thread(target=warm_hot_commands, daemon=True).start()
 
 def run_jarvis(display_callback=None, visualizer_callback=None):
+    init_jarvis()
     print("Jarvis is ready, sir.")
 
+    if SPEECH_WORKER:
+        run_speech_worker(display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return
+
+    if AUDIO_DEVICES:
+        run_devices(parse_devices(AUDIO_DEVICES), display_callback=display_callback,
+                    visualizer_callback=visualizer_callback)
+        return
 
     if porc is None:
         print("Wake-word detector not initialized. Exiting run_jarvis.")
@@ -477,14 +561,18 @@ def run_jarvis(display_callback=None, visualizer_callback=None):
                     pcm = struct.unpack_from(f"<{porc.frame_length}h", data)
                     if porc.process(pcm) >= 0:
                         print("\n[Wake-word detected!]")
+                        start = time.perf_counter()
                         speak("Yes, sir?", visualizer_callback=visualizer_callback)
                         cmd = handle_command(stream)
+                        stt_ms = (time.perf_counter() - start) * 1000
                         if not cmd:
                             continue
-                        if any(w in cmd for w in ("exit", "quit", "goodbye", "stop", "bye")):
+                        if any(w in cmd for w in EXIT_WORDS):
+                            record_command(cmd, "exit", "ok", stt_ms=stt_ms)
                             speak("Goodbye, sir.", display_callback=display_callback, visualizer_callback=visualizer_callback)
                             break
-                        handle_action(cmd, display_callback=display_callback, visualizer_callback=visualizer_callback)
+                        handle_action(cmd, display_callback=display_callback, visualizer_callback=visualizer_callback,
+                                      stt_ms=stt_ms)
             except KeyboardInterrupt:
                 print("\nInterrupted by user")
                 if display_callback:
@@ -0,0 +1,156 @@
+"""
+Action plugin registry.
+
+Every module in this directory (not starting with "_") is an action plugin.
+A plugin declares, as plain literals at module level:
+
+    TRIGGERS = ("screenshot", "screen shot")   # substrings of the command
+    PREFIXES = ("search ",)                    # optional, command prefixes
+    PRIORITY = 30                              # lower is matched first
+
+and a function:
+
+    def run(cmd, speak, display_callback=None, visualizer_callback=None): ...
+
+run() returns False when the action could not be carried out.
+
+The literals are read from the source without importing it, so a plugin and
+its dependencies (pyautogui, pyperclip, ...) are only imported the first time
+one of its triggers matches, or when warm() is given a command that uses it.
+"""
+import ast
+import importlib.util
+import os
+import threading
+
+PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PRIORITY = 100
+
+
+class Plugin:
+
+    def __init__(self, name, path, triggers=(), prefixes=(), priority=DEFAULT_PRIORITY):
+        self.name = name
+        self.path = path
+        self.triggers = tuple(triggers)
+        self.prefixes = tuple(prefixes)
+        self.priority = priority
+        self.module = None
+        self.lock = threading.Lock()
+
+    def matches(self, cmd: str) -> bool:
+        return (any(cmd.startswith(p) for p in self.prefixes)
+                or any(t in cmd for t in self.triggers))
+
+    def load(self):
+        with self.lock:
+            if self.module is None:
+                spec = importlib.util.spec_from_file_location(f"jarvis_plugin_{self.name}", self.path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                self.module = module
+        return self.module
+
+    def run(self, cmd: str, speak, display_callback=None, visualizer_callback=None):
+        return self.load().run(cmd, speak, display_callback=display_callback,
+                               visualizer_callback=visualizer_callback)
+
+
+def read_manifest(path: str) -> dict:
+    """
+    Return the TRIGGERS / PREFIXES / PRIORITY literals of a plugin file.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    manifest = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+            continue
+        target = node.targets[0]
+        if isinstance(target, ast.Name) and target.id in ("TRIGGERS", "PREFIXES", "PRIORITY"):
+            manifest[target.id] = ast.literal_eval(node.value)
+    return manifest
+
+
+class PluginRegistry:
+
+    def __init__(self, directory: str = PLUGIN_DIR):
+        self.directory = directory
+        self.plugins = []
+        self.hot = {}
+
+    def discover(self):
+        found = []
+        try:
+            entries = sorted(os.listdir(self.directory))
+        except OSError as e:
+            print(f"Plugin directory unavailable: {e}")
+            entries = []
+        for entry in entries:
+            if not entry.endswith(".py") or entry.startswith("_"):
+                continue
+            path = os.path.join(self.directory, entry)
+            try:
+                manifest = read_manifest(path)
+            except Exception as e:
+                print(f"Skipping plugin {entry}: {e}")
+                continue
+            if not manifest.get("TRIGGERS") and not manifest.get("PREFIXES"):
+                continue
+            found.append(Plugin(
+                entry[:-3],
+                path,
+                triggers=manifest.get("TRIGGERS", ()),
+                prefixes=manifest.get("PREFIXES", ()),
+                priority=manifest.get("PRIORITY", DEFAULT_PRIORITY),
+            ))
+        found.sort(key=lambda p: (p.priority, p.name))
+        self.plugins = found
+        self.hot = {}
+        return self.plugins
+
+    def _scan(self, cmd: str):
+        for plugin in self.plugins:
+            if plugin.matches(cmd):
+                return plugin
+        return None
+
+    def match(self, cmd: str):
+        plugin = self.hot.get(cmd)
+        if plugin is not None:
+            return plugin
+        return self._scan(cmd)
+
+    def warm(self, commands):
+        """
+        Resolve frequently used commands ahead of time: their plugins are
+        imported now and later lookups of the exact command skip the scan.
+        """
+        hot = {}
+        for cmd in commands:
+            plugin = self._scan(cmd)
+            if plugin is None:
+                continue
+            try:
+                plugin.load()
+            except Exception as e:
+                print(f"Could not preload plugin {plugin.name}: {e}")
+                continue
+            hot[cmd] = plugin
+        self.hot = hot
+        return hot
+
+    def run(self, plugin, cmd: str, speak, display_callback=None, visualizer_callback=None) -> bool:
+        """
+        Run plugin for cmd, reporting exceptions by voice. Returns False when
+        the plugin failed.
+        """
+        try:
+            result = plugin.run(cmd, speak, display_callback=display_callback,
+                                visualizer_callback=visualizer_callback)
+            return result is not False
+        except Exception as e:
+            print(f"Plugin {plugin.name} failed: {e}")
+            speak(f"Sorry, the {plugin.name.replace('_', ' ')} action failed, sir.",
+                  display_callback=display_callback, visualizer_callback=visualizer_callback)
+            return False
@@ -0,0 +1,23 @@
+import time
+import webbrowser
+
+import pyperclip
+
+TRIGGERS = ("clipboard", "search this", "search clipboard")
+PRIORITY = 60
+
+
+def run(cmd, speak, display_callback=None, visualizer_callback=None):
+    speak("Searching the clipboard, sir.", display_callback=display_callback, visualizer_callback=visualizer_callback)
+    time.sleep(1)
+    try:
+        q = pyperclip.paste().strip()
+    except Exception:
+        q = ""
+    if q:
+        webbrowser.open(f"https://www.google.com/search?q={q.replace(' ', '+')}")
+        msg = "Here are the search results, sir."
+        speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return True
+    speak("Clipboard is empty, sir.", display_callback=display_callback, visualizer_callback=visualizer_callback)
+    return False
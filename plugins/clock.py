@@ -0,0 +1,12 @@
+import datetime
+
+TRIGGERS = ("time",)
+PRIORITY = 80
+
+
+def run(cmd, speak, display_callback=None, visualizer_callback=None):
+    now = datetime.datetime.now()
+    timestr = now.strftime('%I:%M %p')
+    msg = f"The current time is {timestr}, sir."
+    speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+    return True
@@ -0,0 +1,26 @@
+import os
+import subprocess
+
+TRIGGERS = ("downloads", "documents", "desktop")
+PRIORITY = 20
+
+FOLDERS = {
+    'downloads': 'Downloads',
+    'documents': 'Documents',
+    'desktop': 'Desktop',
+}
+
+
+def run(cmd, speak, display_callback=None, visualizer_callback=None):
+    folder = next(name for key, name in FOLDERS.items() if key in cmd)
+    path = os.path.join(os.environ.get('USERPROFILE', ''), folder)
+    try:
+        subprocess.Popen(['explorer', path])
+        msg = f"Opening {folder} folder, sir."
+        speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return True
+    except Exception as e:
+        print(f"Open {folder} error: {e}")
+        speak(f"Failed to open {folder}: {e}", display_callback=display_callback,
+              visualizer_callback=visualizer_callback)
+        return False
@@ -0,0 +1,15 @@
+import ctypes
+
+TRIGGERS = ("lock", "lock screen", "lock the screen", "close the screen")
+PRIORITY = 50
+
+
+def run(cmd, speak, display_callback=None, visualizer_callback=None):
+    try:
+        ctypes.windll.user32.LockWorkStation()
+        return True
+    except Exception as e:
+        print(f"Lock screen error: {e}")
+        speak(f"Failed to lock screen: {e}", display_callback=display_callback,
+              visualizer_callback=visualizer_callback)
+        return False
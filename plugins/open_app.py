@@ -0,0 +1,84 @@
+import os
+import subprocess
+import time
+import webbrowser
+
+TRIGGERS = ("open", "launch", "start")
+PRIORITY = 70
+
+ALIASES = {
+    'browser': ['browser', 'chrome', 'firefox', 'edge', 'google', 'web'],
+    'youtube': ['youtube', 'yt', 'you tube', 'tube'],
+    'notepad': ['notepad', 'notes'],
+    'calculator': ['calc', 'calculator'],
+    'terminal': ['terminal', 'cmd', 'powershell', 'shell'],
+    'spotify': ['spotify', 'music'],
+    'vscode': ['vscode', 'code', 'visual studio code'],
+    'epic': ['epic', 'epic games'],
+    'dashboard': ['dashboard', 'home', 'panel'],
+    'teams': ['teams', 'microsoft teams', 'ms teams'],
+}
+
+
+def launch_dashboard(speak, display_callback=None, visualizer_callback=None):
+    try:
+        ps1_path = os.path.expandvars(r"%USERPROFILE%\J.A.R.V.I.S\synq-start.ps1")
+        subprocess.Popen(["powershell", "-ExecutionPolicy", "Bypass", "-File", ps1_path])
+        time.sleep(3)
+        webbrowser.open("http://localhost:3000", new=2)
+        msg = "Dashboard launched, sir."
+        speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return True
+    except Exception as e:
+        print("Error launching dashboard:", e)
+        speak(f"Error launching dashboard: {e}", display_callback=display_callback,
+              visualizer_callback=visualizer_callback)
+        return False
+
+
+def open_application(name: str, speak, display_callback=None, visualizer_callback=None):
+    apps = {
+        'browser': lambda: webbrowser.open('https://www.google.com'),
+        'youtube': lambda: webbrowser.open('https://www.youtube.com'),
+        'notepad': lambda: subprocess.Popen(['notepad']),
+        'calculator': lambda: subprocess.Popen(['calc']),
+        'terminal': lambda: subprocess.Popen(['wt']),
+        'spotify': lambda: subprocess.Popen([
+            os.path.expandvars(r'%USERPROFILE%\AppData\Roaming\Spotify\Spotify.exe')
+        ]),
+        'vscode': lambda: subprocess.Popen([
+            os.path.expandvars(r'%LOCALAPPDATA%\Programs\Microsoft VS Code\Code.exe')
+        ]),
+        'epic': lambda: subprocess.Popen([
+            os.path.expandvars(r'%ProgramFiles(x86)%\Epic Games\Launcher\Portal\Binaries\Win32\EpicGamesLauncher.exe')
+        ]),
+        'dashboard': lambda: launch_dashboard(speak, display_callback=display_callback, visualizer_callback=visualizer_callback),
+        'teams': lambda: subprocess.Popen([
+            os.path.expandvars(r'%LOCALAPPDATA%\Microsoft\Teams\current\Teams.exe')
+        ]),
+    }
+    try:
+        action = apps.get(name)
+        if action:
+            result = action()
+            msg = f"Opening {name}, sir."
+            speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+            return result is not False
+        msg = "I don't know that application, sir."
+        speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return False
+    except Exception as e:
+        print(f"Error opening {name}: {e}")
+        speak(f"Something went wrong opening {name}, sir.",
+              display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return False
+
+
+def run(cmd, speak, display_callback=None, visualizer_callback=None):
+    for name, keys in ALIASES.items():
+        if any(k in cmd for k in keys):
+            return open_application(name, speak, display_callback=display_callback,
+                                    visualizer_callback=visualizer_callback)
+    speak("Which application should I open, sir?", display_callback=display_callback,
+          visualizer_callback=visualizer_callback)
+    return False
@@ -0,0 +1,17 @@
+import ctypes
+
+TRIGGERS = ("recycle",)
+PRIORITY = 40
+
+
+def run(cmd, speak, display_callback=None, visualizer_callback=None):
+    try:
+        ctypes.windll.shell32.SHEmptyRecycleBinW(None, None, 0)
+        msg = "Recycle bin emptied, sir."
+        speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return True
+    except Exception as e:
+        print(f"Empty recycle bin error: {e}")
+        speak(f"Failed to empty recycle bin: {e}", display_callback=display_callback,
+              visualizer_callback=visualizer_callback)
+        return False
@@ -0,0 +1,26 @@
+import datetime
+import os
+
+import pyautogui
+
+TRIGGERS = ("screenshot", "screen shot", "screen capture", "screen grab", "take a picture")
+PRIORITY = 30
+
+
+def run(cmd, speak, display_callback=None, visualizer_callback=None):
+    try:
+        ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        pdir = os.path.join(os.environ.get('USERPROFILE', ''), 'Pictures')
+        if not pdir:
+            raise RuntimeError("USERPROFILE not set")
+        os.makedirs(pdir, exist_ok=True)
+        path = os.path.join(pdir, f'screenshot_{ts}.png')
+        pyautogui.screenshot().save(path)
+        msg = f"Screenshot saved: {path}, sir."
+        speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return True
+    except Exception as e:
+        print(f"Screenshot error: {e}")
+        speak(f"Failed to take screenshot: {e}", display_callback=display_callback,
+              visualizer_callback=visualizer_callback)
+        return False
@@ -0,0 +1,17 @@
+import webbrowser
+
+PREFIXES = ("search ",)
+PRIORITY = 90
+
+
+def run(cmd, speak, display_callback=None, visualizer_callback=None):
+    query = cmd.replace("search", "", 1).strip()
+    if query:
+        msg = f"Searching for {query}, sir."
+        speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+        webbrowser.open(f"https://www.google.com/search?q={query.replace(' ', '+')}")
+        speak("Here are the search results, sir.", display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return True
+    speak("What would you like me to search for, sir?", display_callback=display_callback,
+          visualizer_callback=visualizer_callback)
+    return False
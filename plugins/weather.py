@@ -0,0 +1,81 @@
+import os
+
+import requests
+
+TRIGGERS = ("weather", "temperature", "forecast")
+PRIORITY = 10
+
+
+def get_my_location():
+    try:
+        r = requests.get("http://ip-api.com/json/", timeout=3)
+        r.raise_for_status()
+        loc = r.json()
+        return (
+            loc.get("city"),
+            loc.get("regionName"),
+            loc.get("lat"),
+            loc.get("lon")
+        )
+    except Exception as e:
+        print("Location lookup failed:", e)
+        return (None, None, None, None)
+
+
+def run(cmd, speak, display_callback=None, visualizer_callback=None):
+    """
+    Fetch current weather via WeatherAPI and speak/display it.
+    """
+    WEATHER_API_KEY = os.getenv("weather_api_key")
+    if WEATHER_API_KEY is None:
+        err = "weather_api_key not set; cannot fetch weather."
+        speak(err, display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return False
+
+    city, region, lat, lon = get_my_location()
+    if city:
+        query = city
+    elif lat is not None and lon is not None:
+        query = f"{lat},{lon}"
+    else:
+        speak("Sorry, I couldn't figure out your location, sir.",
+              display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return False
+
+    url = (
+        f"http://api.weatherapi.com/v1/current.json"
+        f"?key={WEATHER_API_KEY}"
+        f"&q={query}"
+        f"&aqi=no"
+    )
+    if display_callback:
+        try:
+            display_callback(f"(Fetching weather for {query})")
+        except Exception:
+            pass
+
+    try:
+        resp = requests.get(url, timeout=5)
+        data = resp.json()
+    except Exception as e:
+        print("WeatherAPI request failed:", e)
+        speak("Sorry, I couldn't connect to the weather service, sir.",
+              display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return False
+
+    if resp.status_code == 200 and "current" in data:
+        temp_c = data["current"].get("temp_c")
+        cond = data["current"].get("condition", {}).get("text", "")
+        loc_name = data.get("location", {}).get("name", "")
+        msg = f"The weather in {loc_name} is {cond} with a temperature of {temp_c} degrees Celsius, sir."
+        speak(msg, display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return True
+    elif "error" in data:
+        msg = data["error"].get("message", "an unknown error")
+        speak(f"WeatherAPI error: {msg}, sir.",
+              display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return False
+    else:
+        speak("Sorry, I couldn't fetch the weather, sir.",
+              display_callback=display_callback, visualizer_callback=visualizer_callback)
+        return False
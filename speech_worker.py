@@ -0,0 +1,238 @@
+"""
+Wake-word detection and speech recognition in a separate process.
+
+The GUI process writes microphone frames into a FrameRing backed by
+multiprocessing.shared_memory; the worker reads them, runs Porcupine and
+Vosk, and sends events back over a queue:
+
+    ("ready",)
+    ("wake", latency_s)
+    ("transcript", text, latency_s, since_wake_s)
+    ("error", message)
+
+latency_s is measured from the moment the triggering frame was written;
+since_wake_s from the wake-word frame (or, without a detector, the first
+frame of the utterance) to the transcript.
+"""
+import json
+import multiprocessing as mp
+import queue
+import struct
+import time
+from multiprocessing import shared_memory
+
+SAMPLE_RATE = 16000
+FRAME_LENGTH = 512
+RING_SLOTS = 256
+POLL_INTERVAL = 0.005
+
+
+class FrameRing:
+    """
+    Single-producer, single-consumer ring of fixed-size PCM frames in shared
+    memory. Layout: write counter, one timestamp per slot, then the frames.
+    The slot the writer fills next is never read, and a frame the writer
+    lapped while it was being copied is discarded, so a reader that falls
+    behind skips to the oldest intact frame.
+    """
+
+    HEADER = 8
+
+    def __init__(self, frame_length=FRAME_LENGTH, slots=RING_SLOTS, name=None):
+        self.frame_bytes = frame_length * 2
+        self.slots = slots
+        self.owner = name is None
+        size = self.HEADER + slots * 8 + slots * self.frame_bytes
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            struct.pack_into("<Q", self.shm.buf, 0, 0)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.read_count = 0
+        self.dropped = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def _count(self):
+        return struct.unpack_from("<Q", self.shm.buf, 0)[0]
+
+    def _data_offset(self, slot):
+        return self.HEADER + self.slots * 8 + slot * self.frame_bytes
+
+    def write(self, data: bytes, timestamp=None):
+        count = self._count()
+        slot = count % self.slots
+        offset = self._data_offset(slot)
+        frame = data[:self.frame_bytes].ljust(self.frame_bytes, b"\0")
+        self.shm.buf[offset:offset + self.frame_bytes] = frame
+        struct.pack_into("<d", self.shm.buf, self.HEADER + slot * 8,
+                         time.monotonic() if timestamp is None else timestamp)
+        struct.pack_into("<Q", self.shm.buf, 0, count + 1)
+
+    def read(self):
+        """
+        Return (frame, timestamp) for the next unread frame, or None.
+        """
+        while True:
+            count = self._count()
+            if self.read_count >= count:
+                return None
+            # Slot count % slots may already be in the middle of a write.
+            oldest = count - self.slots + 1
+            if self.read_count < oldest:
+                self.dropped += oldest - self.read_count
+                self.read_count = oldest
+            slot = self.read_count % self.slots
+            offset = self._data_offset(slot)
+            data = bytes(self.shm.buf[offset:offset + self.frame_bytes])
+            timestamp = struct.unpack_from("<d", self.shm.buf, self.HEADER + slot * 8)[0]
+            if self._count() - self.read_count >= self.slots:
+                # The writer reached this slot while we were copying it.
+                continue
+            self.read_count += 1
+            return data, timestamp
+
+    def close(self):
+        try:
+            self.shm.close()
+            if self.owner:
+                self.shm.unlink()
+        except Exception:
+            pass
+
+
+class SpeechDecoder:
+    """
+    Wake word followed by one transcript, frame by frame. Without a detector
+    every utterance is transcribed.
+    """
+
+    def __init__(self, model, detector=None, sample_rate=SAMPLE_RATE):
+        from vosk import KaldiRecognizer
+
+        self.detector = detector
+        self.rec = KaldiRecognizer(model, sample_rate)
+        self.awake = detector is None
+        self.wake_time = None
+
+    def feed(self, data: bytes, timestamp: float):
+        if not self.awake:
+            pcm = struct.unpack_from(f"<{self.detector.frame_length}h", data)
+            if self.detector.process(pcm) >= 0:
+                self.awake = True
+                self.wake_time = timestamp
+                self.rec.Reset()
+                return [("wake", time.monotonic() - timestamp)]
+            return []
+        if self.wake_time is None:
+            self.wake_time = timestamp
+        if self.rec.AcceptWaveform(data):
+            try:
+                text = json.loads(self.rec.Result()).get("text", "").strip().lower()
+            except Exception:
+                text = ""
+            self.awake = self.detector is None
+            now = time.monotonic()
+            since_wake = now - self.wake_time
+            self.wake_time = None
+            return [("transcript", text, now - timestamp, since_wake)]
+        return []
+
+
+def worker_main(ring_name, frame_length, slots, sample_rate, model_path, access_key, events, stop_event):
+    ring = FrameRing(frame_length, slots, name=ring_name)
+    detector = None
+    try:
+        from vosk import Model
+
+        model = Model(model_path)
+        if access_key:
+            import pvporcupine
+
+            detector = pvporcupine.create(access_key=access_key, keywords=["jarvis"])
+            if detector.frame_length != frame_length or detector.sample_rate != sample_rate:
+                raise RuntimeError(
+                    f"Porcupine expects {detector.frame_length} samples at {detector.sample_rate} Hz"
+                )
+        decoder = SpeechDecoder(model, detector, sample_rate)
+        events.put(("ready",))
+
+        while not stop_event.is_set():
+            frame = ring.read()
+            if frame is None:
+                time.sleep(POLL_INTERVAL)
+                continue
+            for event in decoder.feed(*frame):
+                events.put(event)
+    except Exception as e:
+        events.put(("error", str(e)))
+    finally:
+        if detector is not None:
+            try:
+                detector.delete()
+            except Exception:
+                pass
+        ring.close()
+
+
+class SpeechWorker:
+    """
+    Owns the shared ring and the worker process. Call write() from the audio
+    callback and read events from .events.
+
+    The worker requires a Porcupine access_key unless wake_word is False,
+    which transcribes every utterance and is only meant for benchmarks.
+    """
+
+    def __init__(self, model_path="model", access_key=None, wake_word=True,
+                 sample_rate=SAMPLE_RATE, frame_length=FRAME_LENGTH, slots=RING_SLOTS):
+        self.model_path = model_path
+        self.access_key = access_key
+        self.wake_word = wake_word
+        self.sample_rate = sample_rate
+        self.frame_length = frame_length
+        self.slots = slots
+        self.ring = None
+        self.events = None
+        self.stop_event = None
+        self.process = None
+
+    def start(self, timeout=60):
+        if self.wake_word and not self.access_key:
+            raise ValueError("access_key is required for wake-word detection")
+        ctx = mp.get_context("spawn")
+        self.ring = FrameRing(self.frame_length, self.slots)
+        self.events = ctx.Queue()
+        self.stop_event = ctx.Event()
+        self.process = ctx.Process(
+            target=worker_main,
+            args=(self.ring.name, self.frame_length, self.slots, self.sample_rate,
+                  self.model_path, self.access_key, self.events, self.stop_event),
+            daemon=True,
+        )
+        self.process.start()
+        try:
+            event = self.events.get(timeout=timeout)
+        except queue.Empty:
+            self.stop()
+            raise RuntimeError("Speech worker did not start in time")
+        if event[0] == "error":
+            self.stop()
+            raise RuntimeError(f"Speech worker failed: {event[1]}")
+
+    def write(self, data: bytes):
+        self.ring.write(data)
+
+    def stop(self):
+        if self.stop_event is not None:
+            self.stop_event.set()
+        if self.process is not None:
+            self.process.join(5)
+            if self.process.is_alive():
+                self.process.terminate()
+            self.process = None
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
@@ -0,0 +1,166 @@
+import os
+from collections import deque
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, QTimer
+from PyQt6.QtGui import QColor, QFont, QFontMetrics
+from PyQt6.QtWidgets import QAbstractItemView, QListView, QStyledItemDelegate
+
+MAX_LINES = int(os.getenv("JARVIS_TRANSCRIPT_MAX_LINES", "2000"))
+FLUSH_INTERVAL_MS = 16
+PADDING = 3
+
+
+class TranscriptModel(QAbstractListModel):
+    """
+    Ring buffer of (speaker, text) lines for the transcript view.
+    Appends are queued and flushed to the view at most once per frame.
+    """
+
+    def __init__(self, max_lines: int = MAX_LINES, parent=None):
+        super().__init__(parent)
+        self.max_lines = max(1, max_lines)
+        self.lines = deque(maxlen=self.max_lines)
+        self.pending = []
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.lines)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.lines):
+            return None
+        speaker, text = self.lines[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{speaker}: {text}"
+        if role == Qt.ItemDataRole.UserRole:
+            return speaker, text
+        return None
+
+    def append(self, speaker: str, text: str):
+        self.pending.append((speaker, text))
+        if len(self.pending) > self.max_lines:
+            del self.pending[:-self.max_lines]
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self):
+        if not self.pending:
+            return
+        batch = self.pending
+        self.pending = []
+
+        overflow = len(self.lines) + len(batch) - self.max_lines
+        drop = min(overflow, len(self.lines))
+        if drop > 0:
+            self.beginRemoveRows(QModelIndex(), 0, drop - 1)
+            for _ in range(drop):
+                self.lines.popleft()
+            self.endRemoveRows()
+
+        start = len(self.lines)
+        self.beginInsertRows(QModelIndex(), start, start + len(batch) - 1)
+        self.lines.extend(batch)
+        self.endInsertRows()
+
+    def clear(self):
+        self.flush_timer.stop()
+        self.pending = []
+        self.beginResetModel()
+        self.lines.clear()
+        self.endResetModel()
+
+
+class TranscriptDelegate(QStyledItemDelegate):
+    """
+    Paints a line as a bold speaker prefix followed by word-wrapped plain text,
+    without building a rich-text document per row.
+    """
+
+    def __init__(self, view, speaker_color="#0ff", text_color="#eee"):
+        super().__init__(view)
+        self.view = view
+        self.speaker_color = QColor(speaker_color)
+        self.text_color = QColor(text_color)
+
+    def _fonts(self, option):
+        bold = QFont(option.font)
+        bold.setBold(True)
+        return bold, option.font
+
+    def _text_width(self, prefix_width: int) -> int:
+        return max(1, self.view.viewport().width() - prefix_width - 2 * PADDING)
+
+    def sizeHint(self, option, index):
+        line = index.data(Qt.ItemDataRole.UserRole)
+        if line is None:
+            return super().sizeHint(option, index)
+        speaker, text = line
+        bold, regular = self._fonts(option)
+        prefix_width = QFontMetrics(bold).horizontalAdvance(f"{speaker}: ")
+        width = self._text_width(prefix_width)
+        rect = QFontMetrics(regular).boundingRect(
+            QRect(0, 0, width, 0), Qt.TextFlag.TextWordWrap, text
+        )
+        height = max(rect.height(), QFontMetrics(bold).height())
+        return QSize(prefix_width + width, height + 2 * PADDING)
+
+    def paint(self, painter, option, index):
+        line = index.data(Qt.ItemDataRole.UserRole)
+        if line is None:
+            return
+        speaker, text = line
+        bold, regular = self._fonts(option)
+        prefix = f"{speaker}: "
+        prefix_width = QFontMetrics(bold).horizontalAdvance(prefix)
+        rect = option.rect.adjusted(PADDING, PADDING, -PADDING, -PADDING)
+
+        painter.save()
+        painter.setFont(bold)
+        painter.setPen(self.speaker_color)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, prefix)
+
+        painter.setFont(regular)
+        painter.setPen(self.text_color)
+        painter.drawText(
+            rect.adjusted(prefix_width, 0, 0, 0),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+            text,
+        )
+        painter.restore()
+
+
+class TranscriptView(QListView):
+    """
+    List view over a TranscriptModel that stays pinned to the newest line
+    unless the user has scrolled up.
+    """
+
+    def __init__(self, model: TranscriptModel, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(TranscriptDelegate(self))
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(200)
+        self.setWordWrap(True)
+
+        self.follow = True
+        self.verticalScrollBar().valueChanged.connect(self._track_follow)
+        model.rowsInserted.connect(self._scroll_if_following)
+
+    def _track_follow(self, value: int):
+        bar = self.verticalScrollBar()
+        self.follow = value >= bar.maximum() - 4
+
+    def _scroll_if_following(self, *_):
+        if self.follow:
+            QTimer.singleShot(0, self.scrollToBottom)